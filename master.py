@@ -5,12 +5,13 @@ Features:
 - Users & user management
 - Elements & element management
 - Actions (proposals, votes, linking, etc.)
-- Very simple, JSON-based data persistence
-- Basic search (placeholder for vector-based semantic search)
+- Very simple, JSON-based data persistence (cached in memory, written through on change)
+- Basic search (title substring; optional embedding similarity)
 - FastAPI endpoints (REST-ish)
 - Terminal CLI for quick interaction
 
-Dependencies: fastapi, uvicorn (for quick web server)
+Dependencies: fastapi, uvicorn (for quick web server), orjson
+Optional: uvicorn[standard] (uvloop + httptools for a faster server)
 """
 
 """
@@ -35,6 +36,7 @@ list_elements
 
 search_elements <query>
     - Searches for elements containing the query string in their title
+      (followed by similar titles when SEARCH_SIMILARITY=1)
     - Example: search_elements climate
 
 create_action <user_id> <element_id> <action_type> <content>
@@ -62,17 +64,124 @@ exit
 """
 
 import os
-import json
+import math
+import atexit
+import mmap
+import asyncio
+import time
 import uuid
-from typing import Dict, Any, List, Optional
-from fastapi import FastAPI, HTTPException
+import zlib
+import heapq
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+import orjson
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Set, Tuple
+from fastapi import FastAPI, HTTPException, Query, Response
+from fastapi.responses import JSONResponse
 import uvicorn
 import sys
 
+###############################################################################
+# Helper: Embeddings (Placeholder)
+###############################################################################
+EMBEDDING_DIM = 256
+# Append embedding-similarity hits to search results. Off by default: with the
+# placeholder embed_text this only measures trigram overlap, and the pure
+# Python scan costs far more than the substring match. Enable with
+# SEARCH_SIMILARITY=1 once embed_text is backed by a real model.
+SEARCH_SIMILARITY = os.environ.get("SEARCH_SIMILARITY") == "1"
+# Minimum cosine similarity for an element to count as a semantic search hit
+SEARCH_SIMILARITY_THRESHOLD = 0.5
+
+def embed_text(text: str) -> List[float]:
+    """
+    Placeholder for a real embedding model (e.g. nomic-embed-text via Ollama).
+    Hashes character trigrams of the lowercased text into a fixed-size,
+    unit-length vector. Swap in your own model here, but keep the output
+    normalized: cosine_similarity relies on it.
+    """
+    vec = [0.0] * EMBEDDING_DIM
+    padded = f"  {text.lower()} "
+    for i in range(len(padded) - 2):
+        # crc32 rather than hash(): str hashes are salted per process
+        vec[zlib.crc32(padded[i:i + 3].encode()) % EMBEDDING_DIM] += 1.0
+    norm = math.sqrt(sum(v * v for v in vec))
+    return [v / norm for v in vec] if norm else vec
+
+def embed_texts(texts: List[str]) -> List[List[float]]:
+    """
+    Embed several texts in one call. Real embedding models are much faster
+    per text on batches; replace this together with embed_text.
+    """
+    return [embed_text(text) for text in texts]
+
+def cosine_similarity(a: List[float], b: List[float]) -> float:
+    """Cosine similarity of two unit-length vectors (a plain dot product)."""
+    return sum(x * y for x, y in zip(a, b))
+
+# Concurrent API requests queue their texts here; a background worker embeds
+# whatever arrives within a short window as a single batch.
+EMBED_BATCH_MAX_SIZE = 32
+EMBED_BATCH_WINDOW_SECONDS = 0.005
+_embed_queue: "Optional[asyncio.Queue[Tuple[str, asyncio.Future]]]" = None
+
+async def embed_batched(text: str) -> List[float]:
+    """Embed text via the batching worker (directly if it isn't running)."""
+    if _embed_queue is None:
+        return embed_text(text)
+    future = asyncio.get_running_loop().create_future()
+    await _embed_queue.put((text, future))
+    return await future
+
+async def _embedding_batcher(queue: "asyncio.Queue[Tuple[str, asyncio.Future]]"):
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + EMBED_BATCH_WINDOW_SECONDS
+        while len(batch) < EMBED_BATCH_MAX_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        try:
+            vectors = await asyncio.to_thread(embed_texts, [text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            continue
+        for (_, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
+
+
 ###############################################################################
 # Helper: LLM API (Placeholder)
 ###############################################################################
-def call_llm_api(prompt: str, task: str = "classify") -> Any:
+# Exact cache: byte-identical (task, prompt) pairs, checked before embedding.
+# Maps a digest of the pair to (expires_at, result), least recently used first.
+LLM_EXACT_CACHE_MAX_ENTRIES = 4096
+_LLM_EXACT_CACHE: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+
+# Semantic cache: reuse a previous result when a new prompt for the same task
+# embeds close enough to an earlier one. Off by default: the placeholder
+# embed_text only hashes trigrams, so it scores prompts with opposite meanings
+# (e.g. a proposal with "do not approve" added) as near-identical. Enable with
+# LLM_SEMANTIC_CACHE=1 once embed_text is backed by a real model.
+LLM_SEMANTIC_CACHE = os.environ.get("LLM_SEMANTIC_CACHE") == "1"
+LLM_CACHE_SIMILARITY_THRESHOLD = 0.95
+LLM_CACHE_TTL_SECONDS = 3600.0
+LLM_CACHE_MAX_ENTRIES = 1024
+# (task, prompt vector, expires_at, result)
+_LLM_CACHE: List[Tuple[str, List[float], float, Any]] = []
+_LLM_CACHE_LOCK = threading.Lock()
+
+def _llm_request(prompt: str, task: str) -> Any:
     """
     Placeholder for a large language model API call.
     You might feed in prompt + task, and get classification, rating, etc.
@@ -84,6 +193,54 @@ def call_llm_api(prompt: str, task: str = "classify") -> Any:
         "explanation": "Placeholder LLM result."
     }
 
+def call_llm_api(prompt: str, task: str = "classify", use_cache: bool = True) -> Any:
+    """
+    Call the LLM, answering from the exact-match cache for a repeated
+    prompt, or (if LLM_SEMANTIC_CACHE is on) from the semantic cache when a
+    sufficiently similar prompt was already seen for this task. Pass
+    use_cache=False to always hit the model.
+    """
+    if not use_cache:
+        return _llm_request(prompt, task)
+
+    key = hashlib.blake2b(f"{task}\0{prompt}".encode(), digest_size=16).digest()
+    now = time.monotonic()
+    with _LLM_CACHE_LOCK:
+        hit = _LLM_EXACT_CACHE.get(key)
+        if hit is not None and hit[0] > now:
+            _LLM_EXACT_CACHE.move_to_end(key)
+            return hit[1]
+
+    if LLM_SEMANTIC_CACHE:
+        vector = embed_text(prompt)
+        with _LLM_CACHE_LOCK:
+            _LLM_CACHE[:] = [entry for entry in _LLM_CACHE if entry[2] > now]
+            best_score, best_result = 0.0, None
+            for cached_task, cached_vector, _, result in _LLM_CACHE:
+                if cached_task != task:
+                    continue
+                score = cosine_similarity(vector, cached_vector)
+                if score > best_score:
+                    best_score, best_result = score, result
+            if best_score >= LLM_CACHE_SIMILARITY_THRESHOLD:
+                _remember_exact(key, now + LLM_CACHE_TTL_SECONDS, best_result)
+                return best_result
+
+    result = _llm_request(prompt, task)
+    with _LLM_CACHE_LOCK:
+        if LLM_SEMANTIC_CACHE:
+            _LLM_CACHE.append((task, vector, now + LLM_CACHE_TTL_SECONDS, result))
+            del _LLM_CACHE[:-LLM_CACHE_MAX_ENTRIES]
+        _remember_exact(key, now + LLM_CACHE_TTL_SECONDS, result)
+    return result
+
+def _remember_exact(key: bytes, expires_at: float, result: Any) -> None:
+    """Store a result in the exact-match LRU. Call with the cache lock held."""
+    _LLM_EXACT_CACHE[key] = (expires_at, result)
+    _LLM_EXACT_CACHE.move_to_end(key)
+    if len(_LLM_EXACT_CACHE) > LLM_EXACT_CACHE_MAX_ENTRIES:
+        _LLM_EXACT_CACHE.popitem(last=False)
+
 
 ###############################################################################
 # Data Management
@@ -92,36 +249,203 @@ DATA_DIR = "data"
 USERS_FILE = os.path.join(DATA_DIR, "users.json")
 ELEMENTS_FILE = os.path.join(DATA_DIR, "elements.json")
 ACTIONS_FILE = os.path.join(DATA_DIR, "actions.json")
+# Actions and votes are appended here as JSON lines and periodically
+# compacted into ACTIONS_FILE, instead of rewriting it on every mutation.
+ACTIONS_LOG = os.path.join(DATA_DIR, "actions.log")
+ACTIONS_LOG_COMPACT_EVERY = 10_000
+# Pretty-print data files only when debugging; compact output is much faster.
+DEBUG = os.environ.get("DEBUG") == "1"
+# Mutated collections are written back at most once per interval (and on
+# shutdown). FLUSH_EVERY_WRITE=1 restores writing on every mutation.
+FLUSH_INTERVAL_SECONDS = 1.0
+FLUSH_EVERY_WRITE = os.environ.get("FLUSH_EVERY_WRITE") == "1"
+# Files larger than this are parsed straight from a memory map
+MMAP_THRESHOLD_BYTES = 1 << 20
 
 def ensure_data_files_exist():
     """Create JSON data files if they don't already exist."""
     os.makedirs(DATA_DIR, exist_ok=True)
     for f in [USERS_FILE, ELEMENTS_FILE, ACTIONS_FILE]:
         if not os.path.exists(f):
-            with open(f, "w", encoding="utf-8") as file:
-                json.dump([], file)
+            save_json(f, [])
 
 def load_json(filename: str) -> list:
-    """Load a list of records from JSON."""
-    with open(filename, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """
+    Load a list of records from JSON. Large files are parsed from a read-only
+    memory map, avoiding a full in-memory copy of the file before parsing.
+    """
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD_BYTES:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
 
 def save_json(filename: str, data: list) -> None:
-    """Save a list of records to JSON."""
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    """
+    Save a list of records to JSON in a single write. The data goes to a
+    temporary file that is fsynced and then renamed over filename, so a
+    crash mid-write leaves the previous file intact.
+    """
+    tmp_filename = filename + ".tmp"
+    with open(tmp_filename, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if DEBUG else 0))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_filename, filename)
+
+# In-memory cache of every collection. The JSON files are read once at startup
+# and only written back (write-through) when a collection is mutated.
+_USERS: List[dict] = []
+_ELEMENTS: List[dict] = []
+_ACTIONS: List[dict] = []
+
+# id -> record indexes over the cached lists, so lookups don't scan.
+_USERS_BY_ID: Dict[str, dict] = {}
+_ELEMENTS_BY_ID: Dict[str, dict] = {}
+_ACTIONS_BY_ID: Dict[str, dict] = {}
+# Lowercased element titles, kept parallel to _ELEMENTS for search.
+_ELEMENT_TITLES_LOWER: List[str] = []
+# Title embeddings, parallel to _ELEMENTS (only kept if SEARCH_SIMILARITY).
+# Held off the records so they are neither written to elements.json nor
+# included in API responses.
+_ELEMENT_VECTORS: List[List[float]] = []
+# element id -> set of related ids, mirroring each element's "relationships"
+# list so membership checks don't scan it.
+_ELEMENT_RELATIONSHIPS: Dict[str, Set[str]] = {}
+
+_COLLECTIONS = {
+    "users": (USERS_FILE, _USERS, _USERS_BY_ID),
+    "elements": (ELEMENTS_FILE, _ELEMENTS, _ELEMENTS_BY_ID),
+    "actions": (ACTIONS_FILE, _ACTIONS, _ACTIONS_BY_ID),
+}
+# FastAPI runs sync endpoints in a threadpool, so guard each collection.
+_LOCKS = {kind: threading.Lock() for kind in _COLLECTIONS}
+# Collections changed in memory but not yet written back
+_DIRTY = {kind: False for kind in _COLLECTIONS}
+
+def load_data() -> None:
+    """Populate the in-memory caches and their id indexes from the JSON files."""
+    for filename, data, index in _COLLECTIONS.values():
+        data[:] = load_json(filename)
+        index.clear()
+        index.update({record["id"]: record for record in data})
+    _ELEMENT_TITLES_LOWER[:] = [el["title"].lower() for el in _ELEMENTS]
+    if SEARCH_SIMILARITY:
+        _ELEMENT_VECTORS[:] = embed_texts([el["title"] for el in _ELEMENTS])
+    _ELEMENT_RELATIONSHIPS.clear()
+    _ELEMENT_RELATIONSHIPS.update({el["id"]: set(el["relationships"]) for el in _ELEMENTS})
+    for act in _ACTIONS:
+        _backfill_vote_sum(act)
+    _replay_actions_log()
+
+def _flush(kind: str) -> None:
+    """Write a cached collection back to disk. Call with its lock held."""
+    filename, data, _ = _COLLECTIONS[kind]
+    save_json(filename, data)
+    _DIRTY[kind] = False
+
+def _mark_dirty(kind: str) -> None:
+    """Record that a collection changed. Call with its lock held."""
+    invalidate_responses(kind)
+    if FLUSH_EVERY_WRITE:
+        _flush(kind)
+    else:
+        _DIRTY[kind] = True
+
+def flush_all() -> None:
+    """Write back every collection with unsaved changes."""
+    for kind, lock in _LOCKS.items():
+        with lock:
+            if _DIRTY[kind]:
+                _flush(kind)
+
+_actions_log = None  # append-mode handle on ACTIONS_LOG, opened lazily
+_actions_log_entries = 0
+
+def _add_action(action_record: dict) -> None:
+    _ACTIONS.append(action_record)
+    _ACTIONS_BY_ID[action_record["id"]] = action_record
+
+def _apply_vote(action: dict, user_id: str, vote_value: int) -> None:
+    old_value = action["votes"].get(user_id, 0)
+    action["votes"][user_id] = vote_value
+    action["vote_sum"] += vote_value - old_value
+
+def _backfill_vote_sum(action: dict) -> None:
+    """Give actions saved before vote_sum existed their running total."""
+    if "vote_sum" not in action:
+        action["vote_sum"] = sum(action["votes"].values())
+
+def _replay_actions_log() -> None:
+    """Apply events logged since the last snapshot, then compact them."""
+    global _actions_log_entries
+    if not os.path.exists(ACTIONS_LOG):
+        return
+    with open(ACTIONS_LOG, "rb") as f:
+        lines = f.read().splitlines()
+    for line in lines:
+        try:
+            event = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue  # torn write from a crash mid-append
+        # Creates are skipped if already snapshotted (crash mid-compaction);
+        # votes are idempotent.
+        if event["op"] == "create":
+            if event["action"]["id"] not in _ACTIONS_BY_ID:
+                _backfill_vote_sum(event["action"])
+                _add_action(event["action"])
+        elif event["op"] == "vote":
+            _apply_vote(_ACTIONS_BY_ID[event["action_id"]], event["user_id"], event["value"])
+    _actions_log_entries = len(lines)
+    if _actions_log_entries:
+        compact_actions()
+
+def _encode_action_event(event: dict) -> bytes:
+    """
+    Serialize one actions log line. Do this before touching memory, so an
+    event that cannot be encoded fails without leaving state ahead of the log.
+    """
+    return orjson.dumps(event) + b"\n"
+
+def _log_action_event(line: bytes) -> None:
+    """Append one encoded event to the actions log. Call with the actions lock held."""
+    global _actions_log, _actions_log_entries
+    if _actions_log is None:
+        _actions_log = open(ACTIONS_LOG, "ab")
+    _actions_log.write(line)
+    _actions_log.flush()
+    _actions_log_entries += 1
+    invalidate_responses("actions")
+    if _actions_log_entries >= ACTIONS_LOG_COMPACT_EVERY:
+        compact_actions()
+
+def compact_actions() -> None:
+    """
+    Snapshot all actions into ACTIONS_FILE and truncate the log. The log is
+    only truncated once the snapshot has atomically replaced the old one.
+    """
+    global _actions_log, _actions_log_entries
+    save_json(ACTIONS_FILE, _ACTIONS)
+    if _actions_log is not None:
+        _actions_log.close()
+    _actions_log = open(ACTIONS_LOG, "wb")
+    _actions_log_entries = 0
 
 ensure_data_files_exist()
+load_data()
+# Write back anything still dirty when the interpreter exits, so scripts and
+# library use persist their changes without the app's lifespan or the CLI.
+atexit.register(flush_all)
 
 ###############################################################################
 # Schemas: User, Element, Action
 ###############################################################################
 def create_user(username: str, guiding_values: Optional[List[str]] = None) -> dict:
     """
-    Create a user record with a unique ID and store in users.json.
+    Create a user record with a unique ID (persisted to users.json).
     guiding_values is just an example of user-defined values or preferences.
     """
-    users = load_json(USERS_FILE)
     user_id = str(uuid.uuid4())
     user = {
         "id": user_id,
@@ -130,32 +454,29 @@ def create_user(username: str, guiding_values: Optional[List[str]] = None) -> di
         "history_of_actions": [],
         "associated_elements": []  # track which elements are important to them
     }
-    users.append(user)
-    save_json(USERS_FILE, users)
+    with _LOCKS["users"]:
+        _USERS.append(user)
+        _USERS_BY_ID[user_id] = user
+        _mark_dirty("users")
     return user
 
 def get_user(user_id: str) -> dict:
     """Retrieve user record by ID."""
-    users = load_json(USERS_FILE)
-    for user in users:
-        if user["id"] == user_id:
-            return user
-    raise ValueError("User not found.")
+    try:
+        return _USERS_BY_ID[user_id]
+    except KeyError:
+        raise ValueError("User not found.")
 
 def list_users() -> List[dict]:
     """List all user records."""
-    return load_json(USERS_FILE)
+    return list(_USERS)
 
 def record_user_action(user_id: str, action_id: str) -> None:
     """Add an action ID to user's history of actions."""
-    users = load_json(USERS_FILE)
-    for user in users:
-        if user["id"] == user_id:
-            user["history_of_actions"].append(action_id)
-            break
-    else:
-        raise ValueError("User not found.")
-    save_json(USERS_FILE, users)
+    user = get_user(user_id)
+    with _LOCKS["users"]:
+        user["history_of_actions"].append(action_id)
+        _mark_dirty("users")
 
 def create_element(title: str, element_type: str = "knowledge_piece") -> dict:
     """
@@ -163,10 +484,10 @@ def create_element(title: str, element_type: str = "knowledge_piece") -> dict:
     Has a vector placeholder (for future real embeddings),
     relationships (list of other element IDs), and an action history.
     """
-    elements = load_json(ELEMENTS_FILE)
     element_id = str(uuid.uuid4())
     # A naive random vector or placeholder for demonstration
     vector_placeholder = [0.0, 0.0, 0.0]
+    title_vector = embed_text(title) if SEARCH_SIMILARITY else None
     element = {
         "id": element_id,
         "title": title,
@@ -175,62 +496,83 @@ def create_element(title: str, element_type: str = "knowledge_piece") -> dict:
         "relationships": [],   # store related element IDs
         "history_of_actions": []
     }
-    elements.append(element)
-    save_json(ELEMENTS_FILE, elements)
+    with _LOCKS["elements"]:
+        _ELEMENTS.append(element)
+        _ELEMENTS_BY_ID[element_id] = element
+        _ELEMENT_TITLES_LOWER.append(title.lower())
+        if title_vector is not None:
+            _ELEMENT_VECTORS.append(title_vector)
+        _ELEMENT_RELATIONSHIPS[element_id] = set()
+        _mark_dirty("elements")
     return element
 
 def get_element(element_id: str) -> dict:
-    elements = load_json(ELEMENTS_FILE)
-    for el in elements:
-        if el["id"] == element_id:
-            return el
-    raise ValueError("Element not found.")
+    try:
+        return _ELEMENTS_BY_ID[element_id]
+    except KeyError:
+        raise ValueError("Element not found.")
 
 def list_elements() -> List[dict]:
-    return load_json(ELEMENTS_FILE)
+    return list(_ELEMENTS)
 
 def link_elements(element_id_1: str, element_id_2: str) -> None:
     """
     Create a mutual relationship between two elements in the graph.
     """
-    elements = load_json(ELEMENTS_FILE)
-    idx1, idx2 = None, None
-    for i, el in enumerate(elements):
-        if el["id"] == element_id_1:
-            idx1 = i
-        if el["id"] == element_id_2:
-            idx2 = i
-    if idx1 is None or idx2 is None:
+    el1 = _ELEMENTS_BY_ID.get(element_id_1)
+    el2 = _ELEMENTS_BY_ID.get(element_id_2)
+    if el1 is None or el2 is None:
         raise ValueError("At least one element not found.")
-    # Add each other if not already there
-    if element_id_2 not in elements[idx1]["relationships"]:
-        elements[idx1]["relationships"].append(element_id_2)
-    if element_id_1 not in elements[idx2]["relationships"]:
-        elements[idx2]["relationships"].append(element_id_1)
-    save_json(ELEMENTS_FILE, elements)
+    related_1 = _ELEMENT_RELATIONSHIPS[element_id_1]
+    related_2 = _ELEMENT_RELATIONSHIPS[element_id_2]
+    with _LOCKS["elements"]:
+        if element_id_2 in related_1 and element_id_1 in related_2:
+            return  # already linked, nothing to write
+        # Add each other if not already there
+        if element_id_2 not in related_1:
+            related_1.add(element_id_2)
+            el1["relationships"].append(element_id_2)
+        if element_id_1 not in related_2:
+            related_2.add(element_id_1)
+            el2["relationships"].append(element_id_1)
+        _mark_dirty("elements")
 
 def record_element_action(element_id: str, action_id: str) -> None:
     """Add an action to an element's action history."""
-    elements = load_json(ELEMENTS_FILE)
-    for el in elements:
-        if el["id"] == element_id:
-            el["history_of_actions"].append(action_id)
-            break
-    else:
-        raise ValueError("Element not found.")
-    save_json(ELEMENTS_FILE, elements)
-
-def semantic_search(query: str) -> List[dict]:
+    el = get_element(element_id)
+    with _LOCKS["elements"]:
+        el["history_of_actions"].append(action_id)
+        _mark_dirty("elements")
+
+def semantic_search(
+    query: str, top_k: int = 10, query_vector: Optional[List[float]] = None
+) -> List[dict]:
     """
-    Placeholder for actual vector-based search.
-    We'll just do a naive substring match on title as a stand-in.
+    Title substring matches. With SEARCH_SIMILARITY on, these are followed
+    by up to top_k further elements whose title embedding is close to the
+    query's (cosine similarity of at least SEARCH_SIMILARITY_THRESHOLD),
+    best first. Pass query_vector if the query has already been embedded.
     """
-    elements = load_json(ELEMENTS_FILE)
-    results = []
-    for el in elements:
-        if query.lower() in el["title"].lower():
-            results.append(el)
-    return results
+    q = query.lower()
+    matched = [i for i, title in enumerate(_ELEMENT_TITLES_LOWER) if q in title]
+    if not SEARCH_SIMILARITY:
+        return [_ELEMENTS[i] for i in matched]
+    exact = set(matched)
+    if query_vector is None:
+        query_vector = embed_text(query)
+    scored = (
+        (cosine_similarity(query_vector, vector), i)
+        for i, vector in enumerate(_ELEMENT_VECTORS) if i not in exact
+    )
+    similar = heapq.nlargest(
+        top_k, (item for item in scored if item[0] >= SEARCH_SIMILARITY_THRESHOLD)
+    )
+    return [_ELEMENTS[i] for i in matched] + [_ELEMENTS[i] for _, i in similar]
+
+async def embed_and_search(query: str) -> List[dict]:
+    """semantic_search with the query embedded through the batching worker."""
+    query_vector = await embed_batched(query) if SEARCH_SIMILARITY else None
+    return await asyncio.to_thread(semantic_search, query, query_vector=query_vector)
 
 def create_action(
     user_id: str,
@@ -247,7 +589,6 @@ def create_action(
     - vote on proposals
     - link other elements
     """
-    actions = load_json(ACTIONS_FILE)
     action_id = str(uuid.uuid4())
     action_record = {
         "id": action_id,
@@ -257,14 +598,17 @@ def create_action(
         "content": content,
         "linked_elements": linked_elements or [],
         "votes": {},  # store user_id -> vote_value (e.g., +1, -1, etc.)
+        "vote_sum": 0,  # running total of votes, kept in sync by vote_action
     }
 
     # LLM can classify or moderate new content
     classification_result = call_llm_api(prompt=content, task="moderation")
     action_record["llm_classification"] = classification_result
 
-    actions.append(action_record)
-    save_json(ACTIONS_FILE, actions)
+    line = _encode_action_event({"op": "create", "action": action_record})
+    with _LOCKS["actions"]:
+        _add_action(action_record)
+        _log_action_event(line)
 
     # Update references
     if user_id:
@@ -275,34 +619,34 @@ def create_action(
     return action_record
 
 def get_action(action_id: str) -> dict:
-    actions = load_json(ACTIONS_FILE)
-    for act in actions:
-        if act["id"] == action_id:
-            return act
-    raise ValueError("Action not found.")
+    try:
+        return _ACTIONS_BY_ID[action_id]
+    except KeyError:
+        raise ValueError("Action not found.")
 
 def vote_action(action_id: str, user_id: str, vote_value: int) -> dict:
     """
     A user votes on a given action. For MVP, just store integer votes (+1, -1, etc.).
     """
-    actions = load_json(ACTIONS_FILE)
-    for i, act in enumerate(actions):
-        if act["id"] == action_id:
-            actions[i]["votes"][user_id] = vote_value
-            save_json(ACTIONS_FILE, actions)
-            return actions[i]
-    raise ValueError("Action not found.")
+    act = get_action(action_id)
+    line = _encode_action_event(
+        {"op": "vote", "action_id": action_id, "user_id": user_id, "value": vote_value}
+    )
+    with _LOCKS["actions"]:
+        _apply_vote(act, user_id, vote_value)
+        _log_action_event(line)
+    return act
 
 def list_actions() -> List[dict]:
-    return load_json(ACTIONS_FILE)
+    return list(_ACTIONS)
 
 def calculate_decision_outcome(action_id: str) -> dict:
     """
-    KISS MVP aggregator. For demonstration, let's sum the votes.
+    KISS MVP aggregator. For demonstration, let's sum the votes
+    (maintained incrementally as vote_sum, so this is O(1)).
     """
     action = get_action(action_id)
-    votes = action["votes"]
-    total = sum(votes.values()) if votes else 0
+    total = action["vote_sum"]
     result = {
         "action_id": action_id,
         "type": action["action_type"],
@@ -316,7 +660,85 @@ def calculate_decision_outcome(action_id: str) -> dict:
 ###############################################################################
 # FastAPI App
 ###############################################################################
-app = FastAPI()
+class OrjsonResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson instead of the stdlib json module
+    (FastAPI's own ORJSONResponse is deprecated in newer releases).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+async def _flush_periodically():
+    while True:
+        await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+        await asyncio.to_thread(flush_all)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Encode the OpenAPI schema once, run the periodic flush and the embedding
+    batcher while the app is up; flush once more on shutdown.
+    """
+    global _embed_queue, _openapi_body
+    _openapi_body = orjson.dumps(app.openapi())
+    tasks = []
+    if not FLUSH_EVERY_WRITE:
+        tasks.append(asyncio.create_task(_flush_periodically()))
+    if SEARCH_SIMILARITY:
+        _embed_queue = asyncio.Queue()
+        tasks.append(asyncio.create_task(_embedding_batcher(_embed_queue)))
+    try:
+        yield
+    finally:
+        _embed_queue = None
+        for task in tasks:
+            task.cancel()
+        flush_all()
+
+app = FastAPI(default_response_class=OrjsonResponse, lifespan=lifespan)
+
+# Serialized bodies of read endpoints, grouped by the collection they are
+# built from. Any mutation of a collection drops its whole namespace.
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+_RESPONSE_CACHE: Dict[str, Dict[str, bytes]] = {kind: {} for kind in _COLLECTIONS}
+_RESPONSE_CACHE_GENERATION: Dict[str, int] = {kind: 0 for kind in _COLLECTIONS}
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+def cached_response(namespace: str, key: str, producer: Callable[[], Any]) -> Response:
+    """Serve a cached JSON body, or build it with producer() and cache it."""
+    body = _RESPONSE_CACHE[namespace].get(key)
+    if body is None:
+        generation = _RESPONSE_CACHE_GENERATION[namespace]
+        body = orjson.dumps(producer())
+        _store_response(namespace, key, generation, body)
+    return Response(content=body, media_type="application/json")
+
+async def cached_response_async(
+    namespace: str, key: str, producer: Callable[[], Awaitable[Any]]
+) -> Response:
+    """cached_response for a coroutine producer."""
+    body = _RESPONSE_CACHE[namespace].get(key)
+    if body is None:
+        generation = _RESPONSE_CACHE_GENERATION[namespace]
+        body = orjson.dumps(await producer())
+        _store_response(namespace, key, generation, body)
+    return Response(content=body, media_type="application/json")
+
+def _store_response(namespace: str, key: str, generation: int, body: bytes) -> None:
+    entries = _RESPONSE_CACHE[namespace]
+    with _RESPONSE_CACHE_LOCK:
+        # Don't store a body that a concurrent mutation already made stale
+        if generation == _RESPONSE_CACHE_GENERATION[namespace]:
+            entries[key] = body
+            if len(entries) > RESPONSE_CACHE_MAX_ENTRIES:
+                del entries[next(iter(entries))]
+
+def invalidate_responses(namespace: str) -> None:
+    """Drop every cached response built from the given collection."""
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE_GENERATION[namespace] += 1
+        _RESPONSE_CACHE[namespace].clear()
 
 @app.get("/")
 def read_root():
@@ -331,12 +753,12 @@ def api_create_user(username: str, guiding_values: Optional[List[str]] = None):
 
 @app.get("/users")
 def api_list_users():
-    return list_users()
+    return cached_response("users", "list", list_users)
 
 @app.get("/users/{user_id}")
 def api_get_user(user_id: str):
     try:
-        return get_user(user_id)
+        return cached_response("users", f"get:{user_id}", lambda: get_user(user_id))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -348,11 +770,13 @@ def api_create_element(title: str, element_type: str = "knowledge_piece"):
 
 @app.get("/elements")
 def api_list_elements():
-    return list_elements()
+    return cached_response("elements", "list", list_elements)
 
 @app.get("/elements/search")
-def api_search_elements(query: str):
-    return semantic_search(query)
+async def api_search_elements(query: str):
+    return await cached_response_async(
+        "elements", f"search:{query}", lambda: embed_and_search(query)
+    )
 
 @app.post("/elements/link")
 def api_link_elements(element_id_1: str, element_id_2: str):
@@ -365,7 +789,7 @@ def api_link_elements(element_id_1: str, element_id_2: str):
 @app.get("/elements/{element_id}")
 def api_get_element(element_id: str):
     try:
-        return get_element(element_id)
+        return cached_response("elements", f"get:{element_id}", lambda: get_element(element_id))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -383,19 +807,19 @@ def api_create_action(
 
 @app.get("/actions")
 def api_list_actions():
-    return list_actions()
+    return cached_response("actions", "list", list_actions)
 
 @app.get("/actions/{action_id}")
 def api_get_action(action_id: str):
     try:
-        return get_action(action_id)
+        return cached_response("actions", f"get:{action_id}", lambda: get_action(action_id))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 @app.post("/actions/{action_id}/vote")
-def api_vote_action(action_id: str, user_id: str, vote_value: int):
+def api_vote_action(action_id: str, user_id: str, vote_value: int = Query(..., ge=-1, le=1)):
     """
-    For simplicity, assume vote_value in {+1, -1, 0}.
+    For simplicity, vote_value is restricted to {+1, -1, 0}.
     """
     try:
         return vote_action(action_id, user_id, vote_value)
@@ -407,11 +831,29 @@ def api_vote_action(action_id: str, user_id: str, vote_value: int):
 @app.get("/decisions/{action_id}")
 def api_calculate_decision(action_id: str):
     try:
-        return calculate_decision_outcome(action_id)
+        return cached_response(
+            "actions", f"decision:{action_id}", lambda: calculate_decision_outcome(action_id)
+        )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 
+# --- OpenAPI Schema ---
+# Serve the schema as bytes built once at startup, replacing FastAPI's own
+# route, which generates it on first request and re-encodes it every time.
+_openapi_body: Optional[bytes] = None
+app.router.routes[:] = [
+    route for route in app.router.routes if getattr(route, "path", None) != app.openapi_url
+]
+
+@app.get(app.openapi_url, include_in_schema=False)
+def api_openapi():
+    global _openapi_body
+    if _openapi_body is None:
+        _openapi_body = orjson.dumps(app.openapi())
+    return Response(content=_openapi_body, media_type="application/json")
+
+
 ###############################################################################
 # CLI Interaction (Minimal)
 ###############################################################################
@@ -491,6 +933,7 @@ def cli_mode():
                 print("Unknown command.")
         except Exception as e:
             print("Error:", e)
+        flush_all()
 
 
 ###############################################################################
@@ -500,5 +943,9 @@ if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "cli":
         cli_mode()
     else:
-        # Run FastAPI on default port 8000
+        # Run FastAPI on default port 8000. uvicorn picks uvloop and httptools
+        # by itself when installed (uvicorn[standard]). Stay on one worker:
+        # all state lives in this process's memory and it is the only writer
+        # of the data files, so extra worker processes would diverge and
+        # overwrite each other's changes.
         uvicorn.run("master:app", host="127.0.0.1", port=8000, reload=False)